@@ -1,10 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 from shared.db import get_session
 from shared.models.note import Note, NoteStatus
 from shared.schemas.job import JobRequest
 from core.services.qstash import qstash_service
 from core.services.auth import get_current_user
+from core.services.note_events import note_event_broker
+from core.config import config
+import asyncio
 import logging
 
 router = APIRouter()
@@ -100,3 +105,61 @@ async def get_note_by_url(
         raise HTTPException(status_code=404, detail="Note not found for this video")
         
     return note
+
+@router.get("/notes/{note_id}/events")
+async def stream_note_events(
+    note_id: int,
+    request: Request,
+    last_event_id: Optional[str] = Header(default=None),
+):
+    """
+    Server-Sent Events stream of status transitions and content deltas.
+
+    Sends a snapshot (or the events missed since Last-Event-ID), then
+    live updates, with a comment heartbeat while idle. The stream ends
+    after the note reaches COMPLETED or FAILED. No database session is
+    held while streaming; updates come from the shared note event broker.
+    """
+    user_id = "anonymous"
+    note = await note_event_broker.load(note_id)
+    if not note:
+        raise HTTPException(status_code=404, detail="Note not found")
+
+    # Ensure user owns the note
+    if note.user_id != user_id:
+        raise HTTPException(status_code=403, detail="Not authorized to access this note")
+
+    queue = note_event_broker.subscribe(note_id)
+    initial_events = note_event_broker.replay(note_id, last_event_id)
+
+    async def event_stream():
+        try:
+            # Reconnect after the final event: nothing left to send
+            if not initial_events and note.status in (NoteStatus.COMPLETED, NoteStatus.FAILED):
+                return
+
+            for event in initial_events:
+                yield event.encode()
+                if event.is_terminal:
+                    return
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=config.SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": ping\n\n"
+                    continue
+
+                yield event.encode()
+                if event.is_terminal:
+                    return
+        finally:
+            note_event_broker.unsubscribe(note_id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
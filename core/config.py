@@ -10,6 +10,10 @@ class Config:
     WORKER_URL = os.getenv("WORKER_URL")
     SUPABASE_JWT_SECRET = os.getenv("SUPABASE_JWT_SECRET")
 
+    # Server-Sent Events for note updates
+    NOTE_EVENTS_POLL_INTERVAL = float(os.getenv("NOTE_EVENTS_POLL_INTERVAL", "1.0"))
+    SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+
     @classmethod
     def validate(cls):
         if not cls.DATABASE_URL:
@@ -6,7 +6,9 @@ from slowapi.errors import RateLimitExceeded
 from core.api import notes, payment
 from core.middleware import error_handler_middleware, logging_middleware
 from core.middleware.rate_limit import limiter, rate_limit_exceeded_handler
+from core.services.note_events import note_event_broker
 from shared.utils.logger import get_logger
+from shared.utils.metrics import metrics
 
 logger = get_logger(__name__)
 
@@ -54,6 +56,11 @@ async def health_check():
         "version": "1.0.0"
     }
 
+@app.get("/metrics", tags=["Health"])
+async def get_metrics():
+    """In-process counters, gauges and timings."""
+    return metrics.snapshot()
+
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint."""
@@ -75,5 +82,6 @@ async def startup_event():
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
+    await note_event_broker.stop()
     logger.info("👋 TubeWiki Core API shutting down...")
 
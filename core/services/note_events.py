@@ -0,0 +1,246 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from core.config import config
+from shared.db import get_engine
+from shared.models.note import Note, NoteStatus
+from shared.utils.metrics import metrics
+import logging
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = {NoteStatus.COMPLETED.value, NoteStatus.FAILED.value}
+
+
+@dataclass
+class NoteEvent:
+    """A single Server-Sent Event for one note."""
+    id: str
+    event: str  # "snapshot", "status" or "content"
+    data: Dict[str, Any]
+
+    @property
+    def is_terminal(self) -> bool:
+        status = self.data.get("status")
+        return self.event in ("snapshot", "status") and status in TERMINAL_STATUSES
+
+    def encode(self) -> str:
+        """Serialize in text/event-stream format."""
+        payload = json.dumps(self.data, ensure_ascii=False)
+        return f"id: {self.id}\nevent: {self.event}\ndata: {payload}\n\n"
+
+
+@dataclass
+class _NoteState:
+    status: Optional[str] = None
+    title: Optional[str] = None
+    content: str = ""
+    error_message: Optional[str] = None
+    updated_at: Optional[str] = None
+    seq: int = 0
+    history: Deque[NoteEvent] = field(default_factory=lambda: deque(maxlen=50))
+
+
+class NoteEventBroker:
+    """
+    Fans note status and content changes out to in-process subscribers.
+
+    Subscribers never hold a database connection. While at least one note
+    is being watched, a single background task reads all watched notes in
+    one query every NOTE_EVENTS_POLL_INTERVAL seconds and turns the
+    differences into events. Other change sources can push rows directly
+    through ``publish_note``.
+
+    Event IDs have the form ``<epoch>-<seq>``; the epoch changes whenever
+    the process restarts so stale Last-Event-IDs fall back to a snapshot.
+    """
+
+    def __init__(self, poll_interval: float, max_tracked_notes: int = 1000):
+        self.poll_interval = poll_interval
+        self.max_tracked_notes = max_tracked_notes
+        self.epoch = str(int(time.time()))
+        self.session_factory = None
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = {}
+        self._states: "OrderedDict[int, _NoteState]" = OrderedDict()
+        self._poll_task: Optional[asyncio.Task] = None
+
+    def _session(self) -> AsyncSession:
+        if self.session_factory is None:
+            self.session_factory = sessionmaker(
+                get_engine(), class_=AsyncSession, expire_on_commit=False
+            )
+        return self.session_factory()
+
+    # --- state -----------------------------------------------------------
+
+    def _state(self, note_id: int) -> _NoteState:
+        state = self._states.get(note_id)
+        if state is None:
+            state = _NoteState()
+            self._states[note_id] = state
+            # Forget the least recently touched notes that nobody watches
+            while len(self._states) > self.max_tracked_notes:
+                idle = next((nid for nid in self._states if nid not in self._subscribers), None)
+                if idle is None:
+                    break
+                self._states.pop(idle)
+        else:
+            self._states.move_to_end(note_id)
+        return state
+
+    def _emit(self, note_id: int, state: _NoteState, event: str, data: Dict[str, Any]) -> None:
+        state.seq += 1
+        note_event = NoteEvent(id=f"{self.epoch}-{state.seq}", event=event, data=data)
+        state.history.append(note_event)
+        for queue in self._subscribers.get(note_id, ()):
+            queue.put_nowait(note_event)
+        metrics.incr("note_events.published")
+
+    def publish_note(self, note: Dict[str, Any]) -> None:
+        """
+        Compare a note row with the last known state and emit events for
+        what changed. Content changes are sent as appended deltas when the
+        new text extends the old one.
+        """
+        note_id = note["id"]
+        state = self._state(note_id)
+        content = note.get("content") or ""
+        updated_at = note.get("updated_at")
+        if isinstance(updated_at, datetime):
+            updated_at = updated_at.isoformat()
+        status = note.get("status")
+        if isinstance(status, NoteStatus):
+            status = status.value
+
+        if content != state.content:
+            if content.startswith(state.content):
+                data = {"offset": len(state.content), "delta": content[len(state.content):]}
+            else:
+                data = {"offset": 0, "delta": content, "replace": True}
+            state.content = content
+            self._emit(note_id, state, "content", data)
+
+        if status != state.status or note.get("error_message") != state.error_message:
+            state.status = status
+            state.title = note.get("title")
+            state.error_message = note.get("error_message")
+            self._emit(note_id, state, "status", {
+                "status": status,
+                "title": state.title,
+                "error_message": state.error_message,
+            })
+
+        state.updated_at = updated_at
+
+    def snapshot(self, note_id: int) -> NoteEvent:
+        """Full current state of a note as a single event."""
+        state = self._state(note_id)
+        return NoteEvent(
+            id=f"{self.epoch}-{state.seq}",
+            event="snapshot",
+            data={
+                "id": note_id,
+                "status": state.status,
+                "title": state.title,
+                "content": state.content,
+                "error_message": state.error_message,
+                "updated_at": state.updated_at,
+            }
+        )
+
+    def replay(self, note_id: int, last_event_id: Optional[str]) -> List[NoteEvent]:
+        """
+        Events to send to a (re)connecting client.
+
+        Returns the events after ``last_event_id`` if they are still in the
+        history buffer, otherwise a single snapshot event.
+        """
+        state = self._state(note_id)
+        if last_event_id:
+            epoch, _, seq = last_event_id.partition("-")
+            if epoch == self.epoch and seq.isdigit():
+                seq = int(seq)
+                if seq == state.seq:
+                    return []
+                missed = [e for e in state.history if int(e.id.split("-")[1]) > seq]
+                # History is contiguous; resume only if nothing was dropped
+                if missed and int(missed[0].id.split("-")[1]) == seq + 1:
+                    metrics.incr("note_events.resumed")
+                    return missed
+        return [self.snapshot(note_id)]
+
+    # --- subscriptions ---------------------------------------------------
+
+    def subscribe(self, note_id: int) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(note_id, set()).add(queue)
+        metrics.set_gauge("note_events.subscribers", self.subscriber_count)
+        self._ensure_polling()
+        return queue
+
+    def unsubscribe(self, note_id: int, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(note_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[note_id]
+        metrics.set_gauge("note_events.subscribers", self.subscriber_count)
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    # --- database reads ---------------------------------------------------
+
+    async def load(self, note_id: int) -> Optional[Note]:
+        """Read one note with a short-lived session and update its state."""
+        async with self._session() as session:
+            note = await session.get(Note, note_id)
+        if note:
+            self.publish_note(note.model_dump())
+        return note
+
+    async def poll_once(self) -> None:
+        """Read every watched note in a single query and publish changes."""
+        note_ids = list(self._subscribers)
+        if not note_ids:
+            return
+        async with self._session() as session:
+            results = await session.exec(select(Note).where(Note.id.in_(note_ids)))
+            notes = results.all()
+        metrics.incr("note_events.polls")
+        for note in notes:
+            self.publish_note(note.model_dump())
+
+    def _ensure_polling(self) -> None:
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._poll_loop())
+
+    async def _poll_loop(self) -> None:
+        while self._subscribers:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.warning(f"Note event poll failed: {e}")
+
+    async def stop(self) -> None:
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+            self._poll_task = None
+
+
+note_event_broker = NoteEventBroker(poll_interval=config.NOTE_EVENTS_POLL_INTERVAL)
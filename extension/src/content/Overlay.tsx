@@ -142,7 +142,7 @@ const Overlay: React.FC = () => {
 
                         {note && (
                             <div className="prose prose-sm max-w-none">
-                                {note.status === 'PROCESSING' && (
+                                {(note.status === 'PROCESSING' || note.status === 'GENERATING') && (
                                     <div className="text-center py-4">
                                         <p className="text-gray-500 animate-pulse">Generating content...</p>
                                     </div>
@@ -38,7 +38,7 @@ const Popup = () => {
               try {
                 const existingNote = await api.getNoteByUrl(url)
                 setNote(existingNote)
-                if (existingNote.status === 'PENDING' || existingNote.status === 'PROCESSING') {
+                if (existingNote.status === 'PENDING' || existingNote.status === 'PROCESSING' || existingNote.status === 'GENERATING') {
                   setProcessing(true)
                   pollNote(existingNote.id)
                 }
@@ -184,7 +184,7 @@ const Popup = () => {
                   )}
                 </div>
 
-                {note.status === 'PROCESSING' && (
+                {(note.status === 'PROCESSING' || note.status === 'GENERATING') && (
                   <div className="text-center py-12 bg-white rounded-lg border border-dashed">
                     <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600 mx-auto mb-4"></div>
                     <p className="text-sm text-gray-500">Analyzing video content...</p>
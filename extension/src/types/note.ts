@@ -1,4 +1,4 @@
-export type NoteStatus = 'PENDING' | 'PROCESSING' | 'COMPLETED' | 'FAILED'
+export type NoteStatus = 'PENDING' | 'PROCESSING' | 'GENERATING' | 'COMPLETED' | 'FAILED'
 
 export interface Note {
     id: number
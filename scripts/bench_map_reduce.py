@@ -0,0 +1,70 @@
+"""
+Benchmark: map-reduce summarization latency against transcript length.
+
+Uses a stand-in chat client whose latency grows with prompt size, so the
+numbers show how wall-clock time scales rather than real Groq timings.
+
+Usage:
+    python scripts/bench_map_reduce.py
+"""
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from worker.config import config
+from worker.services.ai import AIService, estimate_tokens
+
+# Simulated provider: fixed overhead plus per-input-token processing time
+BASE_LATENCY = 0.05
+SECONDS_PER_TOKEN = 0.00002
+
+SENTENCE = "今日は機械学習の基礎について説明します。"
+
+
+class FakeCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, model, messages, temperature, **kwargs):
+        self.calls += 1
+        tokens = estimate_tokens(messages[-1]["content"])
+        await asyncio.sleep(BASE_LATENCY + tokens * SECONDS_PER_TOKEN)
+        text = "- 要点のまとめ " * 20
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+async def run_once(service: AIService, transcript: str):
+    completions = FakeCompletions()
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    service.model = "bench"
+
+    started = time.perf_counter()
+    await service.generate_note_content(transcript)
+    return time.perf_counter() - started, completions.calls
+
+
+async def main():
+    service = AIService()
+    print(f"chunk_tokens={config.AI_CHUNK_TOKENS}")
+    print(f"{'concurrency':>11} {'chars':>8} {'~minutes':>9} {'calls':>6} {'seconds':>8} {'s/10k chars':>12}")
+
+    for concurrency in (1, config.AI_MAX_CONCURRENCY, 16):
+        config.AI_MAX_CONCURRENCY = concurrency
+        for chars in (10_000, 20_000, 40_000, 80_000, 160_000):
+            transcript = (SENTENCE * (chars // len(SENTENCE) + 1))[:chars]
+            elapsed, calls = await run_once(service, transcript)
+            # Japanese speech runs at roughly 350 characters per minute
+            minutes = chars / 350
+            print(
+                f"{concurrency:>11} {chars:>8} {minutes:>9.0f} {calls:>6} "
+                f"{elapsed:>8.2f} {elapsed / chars * 10_000:>12.3f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
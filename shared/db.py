@@ -2,6 +2,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
+import sqlalchemy as sa
 import os
 from urllib.parse import urlparse, urlunparse
 from typing import Optional
@@ -83,12 +84,34 @@ def get_engine() -> AsyncEngine:
         logger.error(error_msg)
         raise ValueError(error_msg) from e
 
+def _upgrade_enum_types(conn) -> None:
+    """
+    Add enum members introduced after a table was first created.
+
+    create_all never alters existing tables, so new values (e.g.
+    NoteStatus.GENERATING) must be added to the native Postgres enum type.
+    """
+    if conn.dialect.name != "postgresql":
+        return
+
+    for table in SQLModel.metadata.sorted_tables:
+        for column in table.columns:
+            if isinstance(column.type, sa.Enum) and column.type.name:
+                for value in column.type.enums:
+                    conn.execute(sa.text(
+                        f"ALTER TYPE {column.type.name} ADD VALUE IF NOT EXISTS '{value}'"
+                    ))
+
 async def init_db():
     """Initialize database tables"""
+    # Register every table with SQLModel.metadata before create_all
+    from shared.models import note, transcript  # noqa: F401
+
     engine = get_engine()
     async with engine.begin() as conn:
         # await conn.run_sync(SQLModel.metadata.drop_all)
         await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.run_sync(_upgrade_enum_types)
 
 async def get_session() -> AsyncSession:
     """Get async database session"""
@@ -6,6 +6,7 @@ from enum import Enum
 class NoteStatus(str, Enum):
     PENDING = "PENDING"
     PROCESSING = "PROCESSING"
+    GENERATING = "GENERATING"  # Partial content is being streamed into Note.content
     COMPLETED = "COMPLETED"
     FAILED = "FAILED"
 
@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Optional
+from sqlmodel import SQLModel, Field
+
+class TranscriptCacheEntry(SQLModel, table=True):
+    __tablename__ = "transcript_cache"
+
+    video_id: str = Field(primary_key=True)
+    language: str = Field(primary_key=True)
+    text: str
+    size_bytes: int = Field(default=0)
+    fetch_seconds: float = Field(default=0.0)  # YouTube round-trip this entry saves
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    last_accessed_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+
+class TranscriptLanguages(SQLModel, table=True):
+    __tablename__ = "transcript_languages"
+
+    video_id: str = Field(primary_key=True)
+    selected: str  # Language code picked by YouTubeService for this video
+    available: Optional[str] = None  # JSON list of the video's transcript_list entries
+    created_at: datetime = Field(default_factory=datetime.utcnow)
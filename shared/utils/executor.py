@@ -0,0 +1,111 @@
+"""Bounded thread pool for running blocking I/O off the event loop."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar, Dict, Any
+
+from shared.utils.logger import get_logger
+from shared.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+
+class BoundedExecutor:
+    """
+    Dedicated, size-limited thread pool for blocking calls.
+
+    Each instance publishes the following metrics under its name:
+        <name>.queue_depth     gauge, calls submitted but not yet running
+        <name>.active_threads  gauge, calls currently running in a thread
+        <name>.wait_time       timing, time spent queued before a thread picked the call up
+        <name>.run_time        timing, time spent running in the thread
+        <name>.cancelled       counter, callers that gave up (e.g. on timeout)
+
+    Cancelling the awaiting coroutine (for example via ``asyncio.wait_for``)
+    releases the caller immediately. A call that is still queued is dropped;
+    a call that is already running cannot be interrupted and finishes in the
+    background, but its result is discarded.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=self.name
+            )
+        return self._executor
+
+    def _publish(self) -> None:
+        metrics.set_gauge(f"{self.name}.queue_depth", self._queued)
+        metrics.set_gauge(f"{self.name}.active_threads", self._active)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run ``func(*args)`` on the pool and await its result.
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for ``func``
+
+        Returns:
+            Return value of ``func``
+        """
+        submitted_at = time.monotonic()
+
+        def _call() -> T:
+            started_at = time.monotonic()
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+                self._publish()
+            metrics.observe(f"{self.name}.wait_time", started_at - submitted_at)
+            try:
+                return func(*args)
+            finally:
+                metrics.observe(f"{self.name}.run_time", time.monotonic() - started_at)
+                with self._lock:
+                    self._active -= 1
+                    self._publish()
+
+        with self._lock:
+            self._queued += 1
+            self._publish()
+
+        future = self._get_executor().submit(_call)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # Still waiting for a thread: drop it from the queue
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+                    self._publish()
+            metrics.incr(f"{self.name}.cancelled")
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        """Current pool occupancy."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "queue_depth": self._queued,
+                "active_threads": self._active,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting work and release the threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,82 @@
+"""In-process metrics registry for TubeWiki services."""
+
+import threading
+from collections import defaultdict
+from typing import Dict, Any
+
+
+class Metrics:
+    """
+    Minimal thread-safe registry of counters, gauges and timings.
+
+    Values live in process memory and are exposed through the
+    ``/metrics`` endpoint of each service.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._gauges: Dict[str, float] = {}
+        self._timings: Dict[str, Dict[str, float]] = {}
+
+    def incr(self, name: str, value: float = 1) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self._counters[name] += value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set a gauge to an absolute value."""
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record a duration sample (in seconds)."""
+        with self._lock:
+            timing = self._timings.get(name)
+            if timing is None:
+                timing = {"count": 0, "total": 0.0, "max": 0.0}
+                self._timings[name] = timing
+            timing["count"] += 1
+            timing["total"] += seconds
+            timing["max"] = max(timing["max"], seconds)
+
+    def counter(self, name: str) -> float:
+        """Current value of a counter."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def gauge(self, name: str) -> float:
+        """Current value of a gauge."""
+        with self._lock:
+            return self._gauges.get(name, 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a JSON-serializable copy of all metrics.
+
+        Timings are reported with their count, total, mean and max in seconds.
+        """
+        with self._lock:
+            timings = {
+                name: {
+                    **values,
+                    "mean": values["total"] / values["count"] if values["count"] else 0.0,
+                }
+                for name, values in self._timings.items()
+            }
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "timings": timings,
+            }
+
+    def reset(self) -> None:
+        """Clear all metrics (used by tests)."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._timings.clear()
+
+
+# Process-wide registry
+metrics = Metrics()
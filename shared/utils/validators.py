@@ -150,7 +150,7 @@ def validate_note_status(status: str) -> bool:
     Returns:
         True if valid status
     """
-    valid_statuses = ['PENDING', 'PROCESSING', 'COMPLETED', 'FAILED']
+    valid_statuses = ['PENDING', 'PROCESSING', 'GENERATING', 'COMPLETED', 'FAILED']
     return status in valid_statuses
 
 
@@ -0,0 +1,121 @@
+import asyncio
+import json
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.orm import sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from core.config import config
+from core.services.note_events import NoteEventBroker, note_event_broker
+from shared.models.note import Note, NoteStatus
+
+
+def parse_events(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.split("\n") if not line.startswith(":"))
+        if fields:
+            events.append({"id": fields["id"], "event": fields["event"], "data": json.loads(fields["data"])})
+    return events
+
+
+@pytest.fixture
+def broker_session(session, monkeypatch):
+    factory = sessionmaker(session.bind, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(note_event_broker, "session_factory", factory)
+    monkeypatch.setattr(note_event_broker, "poll_interval", 0.01)
+    yield factory
+    note_event_broker._states.clear()
+
+
+async def create_note(session, **kwargs):
+    note = Note(user_id="anonymous", video_url="https://youtu.be/dQw4w9WgXcQ", **kwargs)
+    session.add(note)
+    await session.commit()
+    await session.refresh(note)
+    return note
+
+
+@pytest.mark.asyncio
+async def test_events_for_completed_note_send_snapshot_and_close(client: AsyncClient, session, broker_session):
+    note = await create_note(session, status=NoteStatus.COMPLETED, content="# Done", title="T")
+
+    response = await client.get(f"/api/v1/notes/{note.id}/events")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_events(response.text)
+    assert [e["event"] for e in events] == ["snapshot"]
+    assert events[0]["data"]["content"] == "# Done"
+    assert events[0]["data"]["status"] == "COMPLETED"
+
+
+@pytest.mark.asyncio
+async def test_events_stream_content_deltas_until_completed(client: AsyncClient, session, broker_session):
+    note = await create_note(session, status=NoteStatus.PROCESSING)
+
+    async def worker_updates():
+        async with broker_session() as worker_session:
+            row = await worker_session.get(Note, note.id)
+            for status, content in (
+                (NoteStatus.GENERATING, "# Title"),
+                (NoteStatus.GENERATING, "# Title\n## Summary"),
+                (NoteStatus.COMPLETED, "# Title\n## Summary\nDone"),
+            ):
+                await asyncio.sleep(0.05)
+                row.status = status
+                row.content = content
+                worker_session.add(row)
+                await worker_session.commit()
+
+    response, _ = await asyncio.gather(
+        client.get(f"/api/v1/notes/{note.id}/events"),
+        worker_updates(),
+    )
+
+    events = parse_events(response.text)
+    assert events[0]["event"] == "snapshot"
+    deltas = [e["data"] for e in events if e["event"] == "content"]
+    assert "".join(d["delta"] for d in deltas) == "# Title\n## Summary\nDone"
+    assert deltas[1]["offset"] == len("# Title")
+    assert events[-1]["event"] == "status"
+    assert events[-1]["data"]["status"] == "COMPLETED"
+    assert note_event_broker.subscriber_count == 0
+
+
+@pytest.mark.asyncio
+async def test_events_not_found(client: AsyncClient, broker_session):
+    response = await client.get("/api/v1/notes/99999/events")
+    assert response.status_code == 404
+
+
+def test_replay_after_last_event_id():
+    broker = NoteEventBroker(poll_interval=1.0)
+    broker.publish_note({"id": 1, "status": "PROCESSING", "content": ""})
+    last_id = broker.snapshot(1).id
+    broker.publish_note({"id": 1, "status": "GENERATING", "content": "abc"})
+    broker.publish_note({"id": 1, "status": "GENERATING", "content": "abcdef"})
+
+    missed = broker.replay(1, last_id)
+    assert [e.event for e in missed] == ["content", "status", "content"]
+    assert missed[-1].data == {"offset": 3, "delta": "def"}
+
+
+def test_replay_with_unknown_event_id_sends_snapshot():
+    broker = NoteEventBroker(poll_interval=1.0)
+    broker.publish_note({"id": 1, "status": "GENERATING", "content": "abc"})
+
+    events = broker.replay(1, "0-5")
+    assert [e.event for e in events] == ["snapshot"]
+    assert events[0].data["content"] == "abc"
+
+
+def test_rewritten_content_is_sent_as_replacement():
+    broker = NoteEventBroker(poll_interval=1.0)
+    queue = asyncio.Queue()
+    broker._subscribers[1] = {queue}
+    broker.publish_note({"id": 1, "status": "GENERATING", "content": "draft"})
+    broker.publish_note({"id": 1, "status": "GENERATING", "content": "final"})
+
+    events = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert events[-1].data == {"offset": 0, "delta": "final", "replace": True}
@@ -0,0 +1,67 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from shared.utils.executor import BoundedExecutor
+from shared.utils.metrics import metrics
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+@pytest.mark.asyncio
+async def test_run_returns_result():
+    executor = BoundedExecutor("test_pool", max_workers=2)
+    try:
+        assert await executor.run(lambda a, b: a + b, 1, 2) == 3
+        assert metrics.snapshot()["timings"]["test_pool.wait_time"]["count"] == 1
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_does_not_block_event_loop():
+    executor = BoundedExecutor("test_pool", max_workers=1)
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    try:
+        await asyncio.gather(executor.run(time.sleep, 0.1), ticker())
+        assert len(ticks) == 5
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_timeout_releases_caller_and_drops_queued_call():
+    executor = BoundedExecutor("test_pool", max_workers=1)
+    release = threading.Event()
+    ran = []
+
+    try:
+        blocker = asyncio.ensure_future(executor.run(release.wait, 5))
+        await asyncio.sleep(0.01)
+        assert executor.stats()["active_threads"] == 1
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(executor.run(ran.append, 1), timeout=0.05)
+
+        assert executor.stats()["queue_depth"] == 0
+        assert metrics.counter("test_pool.cancelled") == 1
+
+        release.set()
+        await blocker
+        assert ran == []
+        assert executor.stats()["active_threads"] == 0
+    finally:
+        release.set()
+        executor.shutdown()
@@ -0,0 +1,28 @@
+from shared.utils.metrics import Metrics
+
+
+def test_counters_and_gauges():
+    m = Metrics()
+    m.incr("hits")
+    m.incr("hits", 2)
+    m.set_gauge("depth", 4)
+    assert m.counter("hits") == 3
+    assert m.gauge("depth") == 4
+    assert m.counter("missing") == 0
+
+
+def test_timings_snapshot():
+    m = Metrics()
+    m.observe("latency", 1.0)
+    m.observe("latency", 3.0)
+    timing = m.snapshot()["timings"]["latency"]
+    assert timing["count"] == 2
+    assert timing["mean"] == 2.0
+    assert timing["max"] == 3.0
+
+
+def test_reset():
+    m = Metrics()
+    m.incr("hits")
+    m.reset()
+    assert m.snapshot() == {"counters": {}, "gauges": {}, "timings": {}}
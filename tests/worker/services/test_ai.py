@@ -90,3 +90,141 @@ async def test_generate_diagram_empty_content(mock_openai):
     
     await service.generate_diagram("")
     service.client.chat.completions.create.assert_called()
+
+@pytest.fixture
+def groq_service():
+    service = AIService()
+    service.client = MagicMock()
+    service.model = "test-model"
+    return service
+
+def make_response(content):
+    response = MagicMock()
+    response.choices[0].message.content = content
+    return response
+
+def test_split_into_chunks_respects_budget():
+    from worker.services.ai import split_into_chunks, estimate_tokens
+    text = "これは文です。" * 2000
+    chunks = split_into_chunks(text, max_tokens=500)
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 500 for chunk in chunks)
+    assert "".join(chunks).replace(" ", "") == text
+
+def test_split_into_chunks_without_punctuation():
+    from worker.services.ai import split_into_chunks, estimate_tokens
+    chunks = split_into_chunks("あ" * 5000, max_tokens=1000)
+    assert len(chunks) >= 5
+    assert all(estimate_tokens(chunk) <= 1000 for chunk in chunks)
+
+@pytest.mark.asyncio
+async def test_generate_note_content_short_transcript_single_call(groq_service):
+    groq_service.client.chat.completions.create = AsyncMock(return_value=make_response("Guide"))
+    assert await groq_service.generate_note_content("short transcript") == "Guide"
+    groq_service.client.chat.completions.create.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_generate_note_content_map_reduce(groq_service):
+    calls = []
+
+    async def fake_create(**kwargs):
+        prompt = kwargs["messages"][1]["content"]
+        calls.append(prompt)
+        if "Transcript part:" in prompt:
+            return make_response("- partial")
+        return make_response("# Final Guide")
+
+    groq_service.client.chat.completions.create = AsyncMock(side_effect=fake_create)
+    transcript = "これは長い講義の文です。" * 3000  # ~36,000 characters
+
+    content = await groq_service.generate_note_content(transcript)
+
+    assert content == "# Final Guide"
+    map_calls = [c for c in calls if "Transcript part:" in c]
+    assert len(map_calls) > 1
+    # The reduce call sees the partial summaries, not a truncated transcript
+    assert "### Part 1" in calls[-1]
+    assert "### Part %d" % len(map_calls) in calls[-1]
+
+@pytest.mark.asyncio
+async def test_generate_note_content_map_reduce_concurrency_cap(groq_service):
+    import asyncio
+    from worker.config import config
+
+    active = 0
+    peak = 0
+
+    async def fake_create(**kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return make_response("- partial")
+
+    groq_service.client.chat.completions.create = AsyncMock(side_effect=fake_create)
+    with patch.object(config, "AI_MAX_CONCURRENCY", 2), patch.object(config, "AI_CHUNK_TOKENS", 1000):
+        await groq_service.generate_note_content("これは文です。" * 5000)
+
+    assert peak == 2
+
+class FakeStream:
+    def __init__(self, deltas):
+        self.deltas = deltas
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for delta in self.deltas:
+            chunk = MagicMock()
+            chunk.choices[0].delta.content = delta
+            yield chunk
+
+@pytest.mark.asyncio
+async def test_generate_note_content_streams_partial_content(groq_service):
+    from worker.config import config
+
+    deltas = ["# Title", "\n", "## Summary", "\n", "text"]
+    groq_service.client.chat.completions.create = AsyncMock(return_value=FakeStream(deltas))
+    partials = []
+
+    async def on_progress(text):
+        partials.append(text)
+
+    with patch.object(config, "AI_STREAMING", True), \
+         patch.object(config, "STREAM_FLUSH_TOKENS", 2), \
+         patch.object(config, "STREAM_FLUSH_MS", 60000):
+        content = await groq_service.generate_note_content("transcript", on_progress=on_progress)
+
+    assert content == "# Title\n## Summary\ntext"
+    assert partials == ["# Title\n", "# Title\n## Summary\n"]
+    assert groq_service.client.chat.completions.create.call_args[1]["stream"] is True
+
+@pytest.mark.asyncio
+async def test_generate_note_content_streaming_survives_flush_failure(groq_service):
+    from worker.config import config
+
+    groq_service.client.chat.completions.create = AsyncMock(return_value=FakeStream(["a", "b", "c"]))
+
+    async def on_progress(text):
+        raise RuntimeError("db down")
+
+    with patch.object(config, "AI_STREAMING", True), patch.object(config, "STREAM_FLUSH_TOKENS", 1):
+        content = await groq_service.generate_note_content("transcript", on_progress=on_progress)
+
+    assert content == "abc"
+
+@pytest.mark.asyncio
+async def test_generate_note_content_streaming_disabled(groq_service):
+    from worker.config import config
+
+    groq_service.client.chat.completions.create = AsyncMock(return_value=make_response("Guide"))
+    on_progress = AsyncMock()
+
+    with patch.object(config, "AI_STREAMING", False):
+        content = await groq_service.generate_note_content("transcript", on_progress=on_progress)
+
+    assert content == "Guide"
+    on_progress.assert_not_called()
+    assert "stream" not in groq_service.client.chat.completions.create.call_args[1]
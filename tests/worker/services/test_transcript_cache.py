@@ -0,0 +1,111 @@
+import os
+import time
+import pytest
+from unittest.mock import patch
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+
+from shared.models.transcript import TranscriptCacheEntry
+from shared.utils.metrics import metrics
+from worker.services.transcript_cache import (
+    CachedTranscript,
+    DatabaseTranscriptStore,
+    DiskTranscriptStore,
+    TranscriptCache,
+)
+
+LIMITS = {"ttl_seconds": 3600, "max_entries": 100, "max_bytes": 1024 * 1024}
+
+
+def make_transcript(video_id="dQw4w9WgXcQ", language="ja", text="こんにちは 世界"):
+    return CachedTranscript(
+        video_id=video_id,
+        language=language,
+        text=text,
+        available_languages=[{"code": "ja", "name": "Japanese", "generated": True}],
+        fetch_seconds=1.5,
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+@pytest.mark.asyncio
+async def test_disk_store_roundtrip(tmp_path):
+    store = DiskTranscriptStore(str(tmp_path), **LIMITS)
+    await store.put(make_transcript())
+
+    cached = await store.get("dQw4w9WgXcQ")
+    assert cached.text == "こんにちは 世界"
+    assert cached.language == "ja"
+    assert cached.available_languages[0]["code"] == "ja"
+    assert await store.get("missing0000") is None
+
+
+@pytest.mark.asyncio
+async def test_disk_store_ttl(tmp_path):
+    store = DiskTranscriptStore(str(tmp_path), **{**LIMITS, "ttl_seconds": 10})
+    with patch("worker.services.transcript_cache.time.time", return_value=time.time() - 60):
+        await store.put(make_transcript())
+    assert await store.get("dQw4w9WgXcQ") is None
+
+
+@pytest.mark.asyncio
+async def test_disk_store_evicts_least_recently_used(tmp_path):
+    store = DiskTranscriptStore(str(tmp_path), **{**LIMITS, "max_entries": 1})
+    await store.put(make_transcript(video_id="aaaaaaaaaaa"))
+    old_path = tmp_path / "aaaaaaaaaaa.ja.json"
+    os.utime(old_path, (time.time() - 100, time.time() - 100))
+    await store.put(make_transcript(video_id="bbbbbbbbbbb"))
+
+    assert await store.evict() == 1
+    assert await store.get("aaaaaaaaaaa") is None
+    assert await store.get("bbbbbbbbbbb") is not None
+
+
+@pytest.mark.asyncio
+async def test_database_store_roundtrip_and_eviction():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    with patch("worker.services.transcript_cache.get_engine", return_value=engine):
+        store = DatabaseTranscriptStore(**{**LIMITS, "max_entries": 1})
+        await store.put(make_transcript(video_id="aaaaaaaaaaa"))
+        await store.put(make_transcript(video_id="bbbbbbbbbbb", language="en", text="hello"))
+
+        cached = await store.get("bbbbbbbbbbb")
+        assert cached.text == "hello"
+        assert cached.language == "en"
+        assert cached.fetch_seconds == 1.5
+
+        assert await store.evict() == 1
+        assert await store.get("aaaaaaaaaaa") is None
+        assert await store.get("bbbbbbbbbbb") is not None
+
+
+@pytest.mark.asyncio
+async def test_cache_counts_hits_and_misses(tmp_path):
+    cache = TranscriptCache(DiskTranscriptStore(str(tmp_path), **LIMITS))
+    assert await cache.get("dQw4w9WgXcQ") is None
+    await cache.put(make_transcript())
+    assert (await cache.get("dQw4w9WgXcQ")).text == "こんにちは 世界"
+
+    assert metrics.counter("transcript_cache.misses") == 1
+    assert metrics.counter("transcript_cache.hits") == 1
+    assert metrics.counter("transcript_cache.seconds_saved") == 1.5
+
+
+@pytest.mark.asyncio
+async def test_cache_read_failure_is_a_miss():
+    class BrokenStore(DiskTranscriptStore):
+        async def get(self, video_id):
+            raise OSError("disk gone")
+
+    cache = TranscriptCache(BrokenStore("/nonexistent", **LIMITS))
+    assert await cache.get("dQw4w9WgXcQ") is None
+    assert metrics.counter("transcript_cache.misses") == 1
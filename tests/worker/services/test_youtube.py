@@ -1,6 +1,7 @@
 import pytest
 from worker.services.youtube import YouTubeService
-from unittest.mock import patch, MagicMock
+from worker.services.transcript_cache import CachedTranscript
+from unittest.mock import patch, MagicMock, AsyncMock
 
 @pytest.fixture
 def service():
@@ -38,3 +39,28 @@ def test_get_transcript_failure(service):
         mock_api.get_transcript.side_effect = Exception("No transcript")
         with pytest.raises(Exception):
             service.get_transcript("https://youtu.be/123")
+
+@pytest.mark.asyncio
+async def test_get_transcript_runs_on_transcript_pool(service):
+    async def run_inline(func, *args):
+        return func(*args)
+
+    fetched = CachedTranscript(video_id="dQw4w9WgXcQ", language="en", text="Hello World")
+    with patch.object(YouTubeService, "_fetch_transcript", return_value=fetched) as mock_fetch, \
+         patch("worker.services.youtube.transcript_executor.run", side_effect=run_inline) as mock_run, \
+         patch("worker.services.youtube.transcript_cache.get", new_callable=AsyncMock, return_value=None), \
+         patch("worker.services.youtube.transcript_cache.put", new_callable=AsyncMock) as mock_put:
+        transcript = await service.get_transcript("https://youtu.be/dQw4w9WgXcQ")
+        assert transcript == "Hello World"
+        mock_run.assert_called_once()
+        mock_fetch.assert_called_once_with("dQw4w9WgXcQ")
+        mock_put.assert_called_once_with(fetched)
+
+@pytest.mark.asyncio
+async def test_get_transcript_cache_hit_skips_youtube(service):
+    cached = CachedTranscript(video_id="dQw4w9WgXcQ", language="ja", text="こんにちは")
+    with patch("worker.services.youtube.transcript_cache.get", new_callable=AsyncMock, return_value=cached), \
+         patch("worker.services.youtube.transcript_executor.run", new_callable=AsyncMock) as mock_run:
+        transcript = await service.get_transcript("https://youtu.be/dQw4w9WgXcQ")
+        assert transcript == "こんにちは"
+        mock_run.assert_not_called()
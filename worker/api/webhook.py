@@ -7,6 +7,7 @@ from worker.services.security import verify_signature
 from worker.services.youtube import youtube_service
 from worker.services.ai import ai_service
 from worker.config import config
+from datetime import datetime
 import logging
 import json
 
@@ -75,7 +76,16 @@ async def process_job(
         logger.debug(f"DEBUG: Transcript fetched. Length: {len(transcript)}")
         
         # B. Generate Content
-        content = await ai_service.generate_note_content(transcript)
+        # Partial markdown is saved while the completion streams so
+        # GET /notes/{id} can return a growing document.
+        async def save_partial_content(partial: str):
+            note.content = partial
+            note.status = NoteStatus.GENERATING
+            note.updated_at = datetime.utcnow()
+            session.add(note)
+            await session.commit()
+
+        content = await ai_service.generate_note_content(transcript, on_progress=save_partial_content)
         
         if not content or len(content.strip()) == 0:
             raise ValueError("Generated content is empty")
@@ -99,6 +109,7 @@ async def process_job(
         note.title = f"Study Guide: {job.video_url}"
         note.status = NoteStatus.COMPLETED
         note.notion_url = notion_url
+        note.updated_at = datetime.utcnow()
         
         session.add(note)
         await session.commit()
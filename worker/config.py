@@ -12,6 +12,26 @@ class Config:
     GROQ_API_KEY = os.getenv("GROQ_API_KEY")
     NOTION_TOKEN = os.getenv("NOTION_TOKEN")
 
+    # Threads reserved for blocking youtube_transcript_api calls
+    TRANSCRIPT_POOL_SIZE = int(os.getenv("TRANSCRIPT_POOL_SIZE", "8"))
+
+    # Transcript cache: "database", "disk" or "none"
+    TRANSCRIPT_CACHE_BACKEND = os.getenv("TRANSCRIPT_CACHE_BACKEND", "disk")
+    TRANSCRIPT_CACHE_DIR = os.getenv("TRANSCRIPT_CACHE_DIR", "/tmp/tubewiki/transcripts")
+    TRANSCRIPT_CACHE_TTL = int(os.getenv("TRANSCRIPT_CACHE_TTL", str(7 * 24 * 3600)))
+    TRANSCRIPT_CACHE_MAX_ENTRIES = int(os.getenv("TRANSCRIPT_CACHE_MAX_ENTRIES", "5000"))
+    TRANSCRIPT_CACHE_MAX_BYTES = int(os.getenv("TRANSCRIPT_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+
+    # Map-reduce summarization for transcripts longer than a single prompt
+    AI_CHUNKED_MODE = os.getenv("AI_CHUNKED_MODE", "true").lower() == "true"
+    AI_CHUNK_TOKENS = int(os.getenv("AI_CHUNK_TOKENS", "3000"))
+    AI_MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", "4"))
+
+    # Stream the study guide and flush partial markdown every N tokens or M ms
+    AI_STREAMING = os.getenv("AI_STREAMING", "true").lower() == "true"
+    STREAM_FLUSH_TOKENS = int(os.getenv("STREAM_FLUSH_TOKENS", "50"))
+    STREAM_FLUSH_MS = int(os.getenv("STREAM_FLUSH_MS", "750"))
+
     @classmethod
     def validate(cls):
         if not cls.DATABASE_URL:
@@ -1,6 +1,8 @@
 from fastapi import FastAPI
 from worker.api import webhook
 from worker.config import config
+from worker.services.youtube import transcript_executor
+from shared.utils.metrics import metrics
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -16,8 +18,19 @@ async def on_startup():
         logger.error(f"Startup failed: {e}")
         raise e
 
+@app.on_event("shutdown")
+async def on_shutdown():
+    transcript_executor.shutdown(wait=False)
+
 app.include_router(webhook.router)
 
 @app.get("/healthz")
 def health_check():
     return {"status": "ok"}
+
+@app.get("/metrics")
+def get_metrics():
+    return {
+        "transcript_pool": transcript_executor.stats(),
+        **metrics.snapshot(),
+    }
@@ -1,9 +1,72 @@
 from openai import AsyncOpenAI
 from worker.config import config
+from shared.utils.metrics import metrics
+from typing import Awaitable, Callable, List, Optional
+import asyncio
 import logging
+import re
+import time
 
 logger = logging.getLogger(__name__)
 
+# Receives the markdown generated so far while a completion is streaming
+ProgressCallback = Callable[[str], Awaitable[None]]
+
+# Transcripts up to this length are summarized in a single call
+MAX_TRANSCRIPT_CHARS = 15000
+
+# Upper bound on map passes before falling back to truncation
+MAX_REDUCE_LEVELS = 3
+
+# Sentence boundaries for Japanese and Latin punctuation
+_SENTENCE_END = re.compile(r'(?<=[。！？!?．.])\s*')
+_CJK_CHAR = re.compile(r'[぀-ヿ㐀-䶿一-鿿＀-￯]')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token estimate: one token per CJK character, ~4 characters per
+    token for everything else.
+    """
+    cjk = len(_CJK_CHAR.findall(text))
+    return cjk + (len(text) - cjk) // 4 + 1
+
+
+def split_into_chunks(text: str, max_tokens: int) -> List[str]:
+    """
+    Split text into chunks of at most ``max_tokens`` estimated tokens,
+    breaking on sentence boundaries where possible.
+    """
+    chunks = []
+    current = []
+    current_tokens = 0
+
+    for sentence in _SENTENCE_END.split(text):
+        if not sentence:
+            continue
+        tokens = estimate_tokens(sentence)
+
+        # Sentence alone exceeds the budget (e.g. captions without punctuation)
+        if tokens > max_tokens:
+            step = max(1, len(sentence) * max_tokens // tokens)
+            pieces = [sentence[i:i + step] for i in range(0, len(sentence), step)]
+        else:
+            pieces = [sentence]
+
+        for piece in pieces:
+            piece_tokens = estimate_tokens(piece)
+            if current and current_tokens + piece_tokens > max_tokens:
+                chunks.append(" ".join(current))
+                current = []
+                current_tokens = 0
+            current.append(piece)
+            current_tokens += piece_tokens
+
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
 class AIService:
     def __init__(self):
         if config.GROQ_API_KEY:
@@ -17,10 +80,106 @@ class AIService:
             self.client = None
             self.model = None
 
-    async def generate_note_content(self, transcript: str) -> str:
+    async def _complete(
+        self,
+        messages: List[dict],
+        temperature: float,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> str:
+        if on_progress and config.AI_STREAMING:
+            return await self._complete_streaming(messages, temperature, on_progress)
+
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature
+        )
+        return response.choices[0].message.content
+
+    async def _complete_streaming(
+        self,
+        messages: List[dict],
+        temperature: float,
+        on_progress: ProgressCallback
+    ) -> str:
+        """
+        Consume a streamed completion, handing the accumulated text to
+        ``on_progress`` every STREAM_FLUSH_TOKENS chunks or STREAM_FLUSH_MS
+        milliseconds, whichever comes first.
+        """
+        started_at = time.monotonic()
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            stream=True
+        )
+
+        parts = []
+        pending_tokens = 0
+        last_flush = time.monotonic()
+        first_token = True
+
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+
+            if first_token:
+                metrics.observe("ai.time_to_first_token", time.monotonic() - started_at)
+                first_token = False
+
+            parts.append(delta)
+            pending_tokens += 1
+
+            elapsed_ms = (time.monotonic() - last_flush) * 1000
+            if pending_tokens >= config.STREAM_FLUSH_TOKENS or elapsed_ms >= config.STREAM_FLUSH_MS:
+                await self._flush_progress(on_progress, "".join(parts))
+                pending_tokens = 0
+                last_flush = time.monotonic()
+
+        # The caller persists the final text itself
+        return "".join(parts)
+
+    async def _flush_progress(self, on_progress: ProgressCallback, text: str) -> None:
+        try:
+            await on_progress(text)
+            metrics.incr("ai.stream_flushes")
+        except Exception as e:
+            # A failed partial save must not abort the generation
+            logger.warning(f"Failed to persist partial content: {e}")
+
+    async def generate_note_content(
+        self,
+        transcript: str,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> str:
+        """
+        Generate the study guide for a transcript.
+
+        Args:
+            transcript: Full transcript text
+            on_progress: Optional coroutine called with the partial markdown
+                while the final completion streams (when AI_STREAMING is on)
+
+        Returns:
+            Complete study guide markdown
+        """
         if not self.client:
             raise ValueError("GROQ_API_KEY is missing")
 
+        if config.AI_CHUNKED_MODE and len(transcript) > MAX_TRANSCRIPT_CHARS:
+            return await self._generate_chunked(transcript, on_progress)
+
+        return await self._generate_study_guide(transcript[:MAX_TRANSCRIPT_CHARS], on_progress)
+
+    async def _generate_study_guide(
+        self,
+        transcript: str,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> str:
         prompt = f"""
         You are an expert study assistant. Create a comprehensive study guide from the following YouTube transcript.
         The output must be in Markdown format.
@@ -52,19 +211,18 @@ class AIService:
         3. [Answer 3]
 
         Transcript:
-        {transcript[:15000]} 
+        {transcript}
         """
         
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
+            content = await self._complete(
+                [
                     {"role": "system", "content": "You are a helpful assistant. You output in the same language as the input text."},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.7
+                temperature=0.7,
+                on_progress=on_progress
             )
-            content = response.choices[0].message.content
             if not content:
                 logger.warning("Groq returned empty content")
                 return ""
@@ -73,6 +231,73 @@ class AIService:
             logger.error(f"Groq generation failed: {e}")
             raise
 
+    async def _generate_chunked(
+        self,
+        transcript: str,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> str:
+        """
+        Map-reduce summarization for transcripts that do not fit one prompt.
+
+        Map: summarize token-budgeted chunks concurrently (capped by
+        AI_MAX_CONCURRENCY). Reduce: merge the partial summaries into the
+        regular study guide. If the partial summaries are themselves too
+        long, they are mapped again before the final reduce, which is the
+        only step that streams.
+        """
+        semaphore = asyncio.Semaphore(config.AI_MAX_CONCURRENCY)
+        text = transcript
+        level = 0
+
+        while len(text) > MAX_TRANSCRIPT_CHARS and level < MAX_REDUCE_LEVELS:
+            chunks = split_into_chunks(text, config.AI_CHUNK_TOKENS)
+            logger.info(f"Map-reduce level {level}: summarizing {len(chunks)} chunks")
+
+            partials = await asyncio.gather(*[
+                self._summarize_chunk(chunk, index, len(chunks), semaphore)
+                for index, chunk in enumerate(chunks)
+            ])
+            text = "\n\n".join(
+                f"### Part {index + 1}\n{partial}"
+                for index, partial in enumerate(partials)
+                if partial
+            )
+            level += 1
+
+        return await self._generate_study_guide(text[:MAX_TRANSCRIPT_CHARS], on_progress)
+
+    async def _summarize_chunk(
+        self,
+        chunk: str,
+        index: int,
+        total: int,
+        semaphore: asyncio.Semaphore
+    ) -> str:
+        prompt = f"""
+        The following is part {index + 1} of {total} of a YouTube transcript.
+        Write dense notes on this part in Markdown bullet points: the main points, key concepts and terms,
+        and any specific examples or details. Do not add an introduction or conclusion.
+
+        IMPORTANT: Output in the same language as the transcript (likely Japanese).
+
+        Transcript part:
+        {chunk}
+        """
+
+        async with semaphore:
+            try:
+                content = await self._complete(
+                    [
+                        {"role": "system", "content": "You are a helpful assistant. You output in the same language as the input text."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.3
+                )
+                return content or ""
+            except Exception as e:
+                logger.error(f"Groq chunk summarization failed (part {index + 1}/{total}): {e}")
+                raise
+
     async def generate_diagram(self, content: str) -> str:
         if not self.client:
             raise ValueError("GROQ_API_KEY is missing")
@@ -98,15 +323,14 @@ class AIService:
         """
 
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
+            content = await self._complete(
+                [
                     {"role": "system", "content": "You are a helpful assistant."},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.2
             )
-            return response.choices[0].message.content.strip()
+            return content.strip()
         except Exception as e:
             logger.error(f"Groq diagram generation failed: {e}")
             # Return empty or None if diagram fails, don't fail the whole job
@@ -0,0 +1,309 @@
+"""Persistent transcript store in front of YouTubeService.get_transcript."""
+
+import asyncio
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+
+from sqlalchemy import delete
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from shared.db import get_engine
+from shared.models.transcript import TranscriptCacheEntry, TranscriptLanguages
+from shared.utils.logger import get_logger
+from shared.utils.metrics import metrics
+from worker.config import config
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CachedTranscript:
+    """A transcript together with the language metadata it was chosen from."""
+
+    video_id: str
+    language: str
+    text: str
+    available_languages: List[Dict[str, Any]] = field(default_factory=list)
+    fetch_seconds: float = 0.0
+
+
+class TranscriptStore(ABC):
+    """
+    Storage backend for cached transcripts.
+
+    Entries are keyed by (video_id, language). The language chosen for a
+    video and its transcript_list metadata are stored alongside so a hit
+    does not need to call YouTube at all.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int, max_bytes: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    @abstractmethod
+    async def get(self, video_id: str) -> Optional[CachedTranscript]:
+        """Return the cached transcript for the video's selected language."""
+
+    @abstractmethod
+    async def put(self, transcript: CachedTranscript) -> None:
+        """Store a transcript and its language metadata."""
+
+    @abstractmethod
+    async def evict(self) -> int:
+        """Drop expired entries, then least recently used ones over the size limits."""
+
+
+class DatabaseTranscriptStore(TranscriptStore):
+    """Stores transcripts in the transcript_cache / transcript_languages tables."""
+
+    def __init__(self, ttl_seconds: int, max_entries: int, max_bytes: int):
+        super().__init__(ttl_seconds, max_entries, max_bytes)
+        self._session_factory = None
+
+    def _session(self) -> AsyncSession:
+        if self._session_factory is None:
+            self._session_factory = sessionmaker(
+                get_engine(), class_=AsyncSession, expire_on_commit=False
+            )
+        return self._session_factory()
+
+    async def get(self, video_id: str) -> Optional[CachedTranscript]:
+        async with self._session() as session:
+            languages = await session.get(TranscriptLanguages, video_id)
+            if not languages:
+                return None
+            entry = await session.get(TranscriptCacheEntry, (video_id, languages.selected))
+            if not entry:
+                return None
+            if datetime.utcnow() - entry.created_at > timedelta(seconds=self.ttl_seconds):
+                return None
+
+            entry.last_accessed_at = datetime.utcnow()
+            session.add(entry)
+            await session.commit()
+
+            return CachedTranscript(
+                video_id=video_id,
+                language=entry.language,
+                text=entry.text,
+                available_languages=json.loads(languages.available or "[]"),
+                fetch_seconds=entry.fetch_seconds,
+            )
+
+    async def put(self, transcript: CachedTranscript) -> None:
+        async with self._session() as session:
+            now = datetime.utcnow()
+            await session.merge(TranscriptCacheEntry(
+                video_id=transcript.video_id,
+                language=transcript.language,
+                text=transcript.text,
+                size_bytes=len(transcript.text.encode("utf-8")),
+                fetch_seconds=transcript.fetch_seconds,
+                created_at=now,
+                last_accessed_at=now,
+            ))
+            await session.merge(TranscriptLanguages(
+                video_id=transcript.video_id,
+                selected=transcript.language,
+                available=json.dumps(transcript.available_languages),
+                created_at=now,
+            ))
+            await session.commit()
+
+    async def evict(self) -> int:
+        async with self._session() as session:
+            cutoff = datetime.utcnow() - timedelta(seconds=self.ttl_seconds)
+            result = await session.execute(
+                delete(TranscriptCacheEntry).where(TranscriptCacheEntry.created_at < cutoff)
+            )
+            evicted = result.rowcount or 0
+
+            # Walk entries from most to least recently used; keep what fits
+            rows = await session.execute(
+                select(
+                    TranscriptCacheEntry.video_id,
+                    TranscriptCacheEntry.language,
+                    TranscriptCacheEntry.size_bytes,
+                ).order_by(TranscriptCacheEntry.last_accessed_at.desc())
+            )
+            total_bytes = 0
+            for index, (video_id, language, size_bytes) in enumerate(rows.all()):
+                total_bytes += size_bytes
+                if index >= self.max_entries or total_bytes > self.max_bytes:
+                    await session.execute(
+                        delete(TranscriptCacheEntry).where(
+                            TranscriptCacheEntry.video_id == video_id,
+                            TranscriptCacheEntry.language == language,
+                        )
+                    )
+                    evicted += 1
+
+            await session.commit()
+            return evicted
+
+
+class DiskTranscriptStore(TranscriptStore):
+    """
+    Stores each transcript as a JSON file under a local directory.
+
+    File modification time tracks recency of use; the creation time used
+    for the TTL is kept inside the file.
+    """
+
+    def __init__(self, directory: str, ttl_seconds: int, max_entries: int, max_bytes: int):
+        super().__init__(ttl_seconds, max_entries, max_bytes)
+        self.directory = Path(directory)
+
+    def _entry_path(self, video_id: str, language: str) -> Path:
+        return self.directory / f"{video_id}.{language}.json"
+
+    def _languages_path(self, video_id: str) -> Path:
+        return self.directory / f"{video_id}.languages.json"
+
+    def _read(self, video_id: str) -> Optional[CachedTranscript]:
+        try:
+            languages = json.loads(self._languages_path(video_id).read_text(encoding="utf-8"))
+            path = self._entry_path(video_id, languages["selected"])
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, KeyError, ValueError):
+            return None
+
+        if time.time() - entry["created_at"] > self.ttl_seconds:
+            return None
+
+        os.utime(path)  # Mark as recently used
+        return CachedTranscript(
+            video_id=video_id,
+            language=languages["selected"],
+            text=entry["text"],
+            available_languages=languages.get("available", []),
+            fetch_seconds=entry.get("fetch_seconds", 0.0),
+        )
+
+    def _write(self, transcript: CachedTranscript) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        entry = {
+            "text": transcript.text,
+            "fetch_seconds": transcript.fetch_seconds,
+            "created_at": now,
+        }
+        languages = {
+            "selected": transcript.language,
+            "available": transcript.available_languages,
+        }
+        # Write to a temp file and rename so readers never see a partial entry
+        for path, payload in (
+            (self._entry_path(transcript.video_id, transcript.language), entry),
+            (self._languages_path(transcript.video_id), languages),
+        ):
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)
+
+    def _evict(self) -> int:
+        if not self.directory.exists():
+            return 0
+
+        entries = []
+        for path in self.directory.glob("*.json"):
+            if path.name.endswith(".languages.json"):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        evicted = 0
+        total_bytes = 0
+        now = time.time()
+        entries.sort(key=lambda item: item[0], reverse=True)
+        for index, (mtime, size, path) in enumerate(entries):
+            total_bytes += size
+            expired = now - mtime > self.ttl_seconds
+            if expired or index >= self.max_entries or total_bytes > self.max_bytes:
+                path.unlink(missing_ok=True)
+                evicted += 1
+        return evicted
+
+    async def get(self, video_id: str) -> Optional[CachedTranscript]:
+        return await asyncio.to_thread(self._read, video_id)
+
+    async def put(self, transcript: CachedTranscript) -> None:
+        await asyncio.to_thread(self._write, transcript)
+
+    async def evict(self) -> int:
+        return await asyncio.to_thread(self._evict)
+
+
+class TranscriptCache:
+    """
+    Read-through cache wrapper that counts hits and misses.
+
+    Cache failures are logged and treated as misses so a broken backend
+    never fails a job.
+    """
+
+    def __init__(self, store: Optional[TranscriptStore], evict_every: int = 50):
+        self.store = store
+        self.evict_every = evict_every
+        self._puts = 0
+
+    async def get(self, video_id: str) -> Optional[CachedTranscript]:
+        if self.store is None:
+            return None
+        try:
+            cached = await self.store.get(video_id)
+        except Exception as e:
+            logger.warning(f"Transcript cache read failed: {e}", extra={"video_id": video_id})
+            cached = None
+
+        if cached is None:
+            metrics.incr("transcript_cache.misses")
+            return None
+
+        metrics.incr("transcript_cache.hits")
+        metrics.incr("transcript_cache.seconds_saved", cached.fetch_seconds)
+        return cached
+
+    async def put(self, transcript: CachedTranscript) -> None:
+        if self.store is None:
+            return
+        try:
+            await self.store.put(transcript)
+            self._puts += 1
+            if self._puts % self.evict_every == 0:
+                evicted = await self.store.evict()
+                metrics.incr("transcript_cache.evictions", evicted)
+        except Exception as e:
+            logger.warning(f"Transcript cache write failed: {e}", extra={"video_id": transcript.video_id})
+
+
+def build_transcript_cache() -> TranscriptCache:
+    """Create the transcript cache selected by TRANSCRIPT_CACHE_BACKEND."""
+    backend = config.TRANSCRIPT_CACHE_BACKEND
+    limits = {
+        "ttl_seconds": config.TRANSCRIPT_CACHE_TTL,
+        "max_entries": config.TRANSCRIPT_CACHE_MAX_ENTRIES,
+        "max_bytes": config.TRANSCRIPT_CACHE_MAX_BYTES,
+    }
+    if backend == "database":
+        return TranscriptCache(DatabaseTranscriptStore(**limits))
+    if backend == "disk":
+        return TranscriptCache(DiskTranscriptStore(config.TRANSCRIPT_CACHE_DIR, **limits))
+    if backend != "none":
+        logger.warning(f"Unknown TRANSCRIPT_CACHE_BACKEND '{backend}', transcript cache disabled")
+    return TranscriptCache(None)
+
+
+transcript_cache = build_transcript_cache()
@@ -1,13 +1,21 @@
 from youtube_transcript_api import YouTubeTranscriptApi
 from urllib.parse import urlparse, parse_qs
+import time
 
 from shared.utils.logger import get_logger
 from shared.utils.retry import with_retry, timeout
 from shared.utils.exceptions import YouTubeAPIError, TranscriptNotAvailableError
 from shared.utils.validators import validate_youtube_url
+from shared.utils.executor import BoundedExecutor
+from shared.utils.metrics import metrics
+from worker.config import config
+from worker.services.transcript_cache import transcript_cache, CachedTranscript
 
 logger = get_logger(__name__)
 
+# youtube_transcript_api is synchronous; keep it off the event loop
+transcript_executor = BoundedExecutor("transcript_pool", max_workers=config.TRANSCRIPT_POOL_SIZE)
+
 
 class YouTubeService:
     def extract_video_id(self, url: str) -> str:
@@ -30,6 +38,11 @@ class YouTubeService:
     async def get_transcript(self, video_url: str) -> str:
         """
         Fetch transcript for a YouTube video with retry and timeout.
+
+        Transcripts are served from the transcript cache when possible.
+        On a miss, the blocking youtube_transcript_api calls run on the
+        dedicated transcript thread pool so the event loop stays free for
+        other jobs.
         
         Args:
             video_url: YouTube video URL
@@ -43,72 +56,34 @@ class YouTubeService:
         """
         try:
             video_id = self.extract_video_id(video_url)
+
+            cached = await transcript_cache.get(video_id)
+            if cached:
+                logger.info(
+                    f"Transcript cache hit",
+                    extra={"video_id": video_id, "language": cached.language}
+                )
+                return cached.text
+
             logger.info(f"Fetching transcript for video: {video_id}")
-            
-            # Instantiate API (not thread-safe, so new instance per request)
-            yt_api = YouTubeTranscriptApi()
-            
-            # Get transcript list
-            try:
-                transcript_list = yt_api.list(video_id)
-            except Exception as e:
-                # If listing fails, try direct fetch as fallback (sometimes works when list fails)
-                logger.warning(f"list() failed, trying direct fetch(): {e}")
-                try:
-                    # Try fetching ja, then en, then en-US
-                    # fetch() returns FetchedTranscript which is iterable of snippets
-                    fetched_transcript = yt_api.fetch(video_id, languages=['ja', 'en', 'en-US'])
-                    
-                    # Helper to format data
-                    full_text = " ".join([t.text for t in fetched_transcript])
-                    logger.info(f"Successfully fetched transcript via fallback", extra={"video_id": video_id, "length": len(full_text)})
-                    return full_text
-                except Exception as direct_error:
-                    raise e  # Raise the original list error if fallback also fails
-
-            # Filter: prefer 'ja', then 'en'
-            transcript = None
-            try:
-                # Try manual first
-                transcript = transcript_list.find_manually_created_transcript(['ja', 'en', 'en-US'])
-            except Exception:
-                # Try generated
-                try:
-                    transcript = transcript_list.find_generated_transcript(['ja', 'en', 'en-US'])
-                except Exception:
-                    # Fallback to the first available
-                    try:
-                        transcript = next(iter(transcript_list))
-                    except StopIteration:
-                        raise TranscriptNotAvailableError(
-                            video_id,
-                            details={"reason": "No transcripts available"}
-                        )
-            
-            # Fetch the actual data
-            # fetch() returns FetchedTranscript
-            data = transcript.fetch()
-            
-            # Combine text
-            parts = []
-            for t in data:
-                # t is FetchedTranscriptSnippet
-                if hasattr(t, 'text'):
-                    parts.append(t.text)
-                elif isinstance(t, dict) and 'text' in t:
-                    parts.append(t['text'])
-            
-            full_text = " ".join(parts)
+
+            started_at = time.monotonic()
+            fetched = await transcript_executor.run(self._fetch_transcript, video_id)
+            fetched.fetch_seconds = time.monotonic() - started_at
+            metrics.observe("transcript.fetch_time", fetched.fetch_seconds)
+
+            await transcript_cache.put(fetched)
             
             logger.info(
                 f"Successfully fetched transcript",
                 extra={
                     "video_id": video_id,
-                    "length": len(full_text)
+                    "language": fetched.language,
+                    "length": len(fetched.text)
                 }
             )
             
-            return full_text
+            return fetched.text
             
         except TranscriptNotAvailableError:
             raise
@@ -125,6 +100,87 @@ class YouTubeService:
                 details={"video_url": video_url}
             )
 
+    def _fetch_transcript(self, video_id: str) -> CachedTranscript:
+        """
+        Blocking transcript download. Runs on the transcript thread pool.
 
-youtube_service = YouTubeService()
+        Args:
+            video_id: YouTube video ID
 
+        Returns:
+            Transcript text with the chosen language and the video's
+            available transcript languages
+        """
+        # Instantiate API (not thread-safe, so new instance per request)
+        yt_api = YouTubeTranscriptApi()
+        
+        # Get transcript list
+        try:
+            transcript_list = yt_api.list(video_id)
+        except Exception as e:
+            # If listing fails, try direct fetch as fallback (sometimes works when list fails)
+            logger.warning(f"list() failed, trying direct fetch(): {e}")
+            try:
+                # Try fetching ja, then en, then en-US
+                # fetch() returns FetchedTranscript which is iterable of snippets
+                fetched_transcript = yt_api.fetch(video_id, languages=['ja', 'en', 'en-US'])
+                
+                # Helper to format data
+                full_text = " ".join([t.text for t in fetched_transcript])
+                logger.info(f"Successfully fetched transcript via fallback", extra={"video_id": video_id, "length": len(full_text)})
+                language = getattr(fetched_transcript, "language_code", "unknown")
+                return CachedTranscript(
+                    video_id=video_id,
+                    language=language,
+                    text=full_text,
+                    available_languages=[{"code": language}]
+                )
+            except Exception as direct_error:
+                raise e  # Raise the original list error if fallback also fails
+
+        # Filter: prefer 'ja', then 'en'
+        transcript = None
+        try:
+            # Try manual first
+            transcript = transcript_list.find_manually_created_transcript(['ja', 'en', 'en-US'])
+        except Exception:
+            # Try generated
+            try:
+                transcript = transcript_list.find_generated_transcript(['ja', 'en', 'en-US'])
+            except Exception:
+                # Fallback to the first available
+                try:
+                    transcript = next(iter(transcript_list))
+                except StopIteration:
+                    raise TranscriptNotAvailableError(
+                        video_id,
+                        details={"reason": "No transcripts available"}
+                    )
+        
+        # Fetch the actual data
+        # fetch() returns FetchedTranscript
+        data = transcript.fetch()
+        
+        # Combine text
+        parts = []
+        for t in data:
+            # t is FetchedTranscriptSnippet
+            if hasattr(t, 'text'):
+                parts.append(t.text)
+            elif isinstance(t, dict) and 'text' in t:
+                parts.append(t['text'])
+        
+        available = [
+            {"code": t.language_code, "name": t.language, "generated": t.is_generated}
+            for t in transcript_list
+        ]
+
+        return CachedTranscript(
+            video_id=video_id,
+            language=transcript.language_code,
+            text=" ".join(parts),
+            available_languages=available
+        )
+
+
+youtube_service = YouTubeService()